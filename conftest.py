@@ -0,0 +1,19 @@
+"""pytest configuration shared by the test modules."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make main, styles and test_utils importable however pytest is invoked; run
+# once per session instead of in every test module
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_working_directory(tmp_path, monkeypatch):
+    """Run each test in its own empty directory.
+
+    main.py reads and writes directory_config.json in the working directory,
+    so tests running in parallel (pytest -n auto) would otherwise share it.
+    """
+    monkeypatch.chdir(tmp_path)
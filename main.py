@@ -1,27 +1,77 @@
 import os
 import sys
 import shutil
-import filecmp
+import mmap
+import time
+import queue
+import contextlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+import importlib
 from pathlib import Path
-from tkinter import *
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
 import json
 from styles import apply_modern_style, COLORS, create_title_label, create_button
 
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# Tk is only loaded once a window is opened, so importing main (the tests,
+# the sync code) doesn't pay for it
+tk = _LazyModule('tkinter')
+ttk = _LazyModule('tkinter.ttk')
+filedialog = _LazyModule('tkinter.filedialog')
+messagebox = _LazyModule('tkinter.messagebox')
+
+try:
+    import xxhash  # Optional: resolves same-size, different-mtime files by hash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson  # Optional: faster config and manifest (de)serialization
+except ImportError:
+    orjson = None
+
+# Larger read/write chunks for the copyfileobj() fallback; Windows already uses 1 MiB
+shutil.COPY_BUFSIZE = 1024 * 1024
+
 # Constants
+# PyInstaller creates a temp folder and stores path in _MEIPASS; it can't
+# change during a run, so resolve it once
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS  # type: ignore
-    except Exception:
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 ICON_PATH = get_resource_path(os.path.join('resources', 'app_icon_final.ico'))
+_HAS_ICON = os.path.exists(ICON_PATH)
 CONFIG_FILE = 'directory_config.json'
+_config_cache = None  # (file key, config) from the last load_config/save_config
+_UNLISTED = object()  # Target whose folder wasn't listed; _needs_copy() stats it
+_CASE_INSENSITIVE = sys.platform in ('win32', 'darwin')  # Default file systems ignore case
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+MAX_PENDING_COPIES = COPY_WORKERS * 64  # Queued copies before the walk waits for the pool
+KERNEL_COPY_CHUNK = 1 << 30  # Largest count accepted by sendfile() on every platform
+MMAP_COPY_THRESHOLD = 1 << 20  # Fallback copies above this size write from an mmap
+MTIME_WINDOW = 1  # Seconds two mtimes may differ and still count as equal
+UPDATE_INTERVAL = 1 / 30  # Seconds between progress window redraws
+HASH_MANIFEST = '.armr_hashes.json'  # Content hashes kept in the destination root
+HASH_BLOCK_SIZE = 1024 * 1024
+COMPARE_BLOCK_SIZE = 1024 * 1024
+POLL_INTERVAL_MS = 50  # How often the progress window drains the sync thread's queue
+
+if sys.platform == 'win32':
+    import ctypes
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
 
 class ProgressWindow:
     def __init__(self, title="Copying Files"):
@@ -30,34 +80,42 @@ class ProgressWindow:
         self.window.geometry("500x200")
         
         # Set icon
-        if os.path.exists(ICON_PATH):
+        if _HAS_ICON:
             self.window.iconbitmap(ICON_PATH)
         
-        # Make it modal
+        # Make it modal; it closes itself when the sync finishes
         self.window.transient()
         self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # Create main frame
         main_frame = ttk.Frame(self.window, style='Modern.TFrame', padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Labels show Tcl variables, so updates are a variable set rather
+        # than a widget reconfigure
+        self.file_var = tk.StringVar(self.window, value="Preparing...")
+        self.stats_var = tk.StringVar(self.window, value="")
+        self.progress_var = tk.DoubleVar(self.window, value=0)
+        
         # Current file label
         self.file_label = ttk.Label(main_frame, 
-                                  text="Preparing...", 
+                                  textvariable=self.file_var, 
                                   style='Modern.TLabel',
                                   wraplength=480)
         self.file_label.pack(pady=10)
         
-        # Progress bar
+        # Progress bar; indeterminate until set_total() reports the file count
         self.progress = ttk.Progressbar(main_frame, 
                                       length=400, 
-                                      mode='determinate',
+                                      mode='indeterminate',
+                                      variable=self.progress_var,
                                       style='Modern.Horizontal.TProgressbar')
         self.progress.pack(pady=15)
         
         # Stats label
         self.stats_label = ttk.Label(main_frame, 
-                                   text="", 
+                                   textvariable=self.stats_var, 
                                    style='Modern.TLabel')
         self.stats_label.pack(pady=10)
         
@@ -69,80 +127,547 @@ class ProgressWindow:
         y = (self.window.winfo_screenheight() // 2) - (height // 2)
         self.window.geometry(f'{width}x{height}+{x}+{y}')
         
-    def update(self, file_path, current, total):
-        # Update file label
-        self.file_label.config(text=f"Copying: {os.path.basename(file_path)}")
+        # Start of the transfer (for the copy rate) and time of the last redraw
+        self._start = time.monotonic()
+        self._last = 0.0
+        self.total = None
         
-        # Update progress bar
-        progress_percent = (current / total) * 100
-        self.progress['value'] = progress_percent
+    def set_total(self, total):
+        """Switch the progress bar to determinate once the file count is known."""
+        self.total = total
+        self.progress.config(mode='determinate', maximum=max(total, 1))
+        
+    def update(self, file_path, current, bytes_done, name=None):
+        # Redraw at most ~30 times a second; updating the widgets for every
+        # file would otherwise dominate small-file syncs. The last file is
+        # always drawn, so the bar ends full.
+        now = time.monotonic()
+        if now - self._last < UPDATE_INTERVAL and current != self.total:
+            return
+        self._last = now
+        
+        # Update file label; the sync passes the name from its directory listing
+        if name is None:
+            name = os.path.basename(file_path)
+        self.file_var.set(f"Copying: {name}")
+        
+        # Advance progress bar
+        if self.total is None:
+            self.progress.step()
+            files = f"{current} files"
+        else:
+            self.progress_var.set(min(current, self.total))
+            files = f"{current} of {self.total} files"
         
         # Update stats
-        self.stats_label.config(text=f"Progress: {current} of {total} files ({progress_percent:.1f}%)")
+        elapsed = now - self._start
+        rate = bytes_done / elapsed if elapsed > 0 else 0
+        self.stats_var.set(f"Processed {files}, {format_size(bytes_done)} copied "
+                           f"({format_size(rate)}/s)")
+    
+    def poll(self, progress_queue):
+        """Show the latest queued progress event; close once the sync thread posts None.
+
+        An int on the queue is the total file count, posted once counting ends.
+        """
+        latest = None
+        finished = False
+        while True:
+            try:
+                event = progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is None:
+                finished = True
+                break
+            if isinstance(event, int):
+                self.set_total(event)
+            else:
+                latest = event
         
-        # Force update
-        self.window.update()
+        if latest is not None:
+            self.update(*latest)
+        
+        if finished:
+            self.close()
+        else:
+            self.window.after(POLL_INTERVAL_MS, self.poll, progress_queue)
+    
+    def wait(self, progress_queue):
+        """Run the Tk event loop, showing queued progress, until the sync finishes."""
+        # The first poll runs from the event loop: if the sync has already
+        # posted None, closing before wait_window() would leave no window to wait on
+        self.window.after(0, self.poll, progress_queue)
+        self.window.wait_window()
     
     def close(self):
         self.window.destroy()
 
+def format_size(num_bytes):
+    """Format a byte count for display, e.g. 1536 -> '1.5 KB'."""
+    if num_bytes < 1024:
+        return f"{num_bytes:.0f} B"
+    for unit in ('KB', 'MB', 'GB'):
+        num_bytes /= 1024
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+    return f"{num_bytes / 1024:.1f} TB"
+
 def count_files(directory):
     """Count total number of files in directory and subdirectories."""
+    # Entry types come from the directory listing itself, so apart from
+    # symlinks nothing is stat'ed and no per-folder lists are built
     total = 0
-    for root, _, files in os.walk(directory):
-        total += len(files)
+    stack = [directory]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # _walk() doesn't copy the root manifest, so don't count it
+                if folder == directory and entry.name == HASH_MANIFEST:
+                    continue
+                if entry.is_dir():
+                    # Like os.walk(), don't descend into symlinked folders
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    total += 1
     return total
 
+def _config_key():
+    """Identify the current config file contents by path, size and mtime."""
+    st = os.stat(CONFIG_FILE)
+    return (os.path.abspath(CONFIG_FILE), st.st_size, st.st_mtime_ns)
+
 def load_config():
     """Load directory configuration from JSON file."""
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    global _config_cache
+    try:
+        key = _config_key()
+    except FileNotFoundError:
+        return {}
+
+    # Only re-read the file when it changed since we last read or wrote it
+    if _config_cache is None or _config_cache[0] != key:
+        with open(CONFIG_FILE, 'rb') as f:
+            _config_cache = (key, _json_loads(f.read()))
+    return dict(_config_cache[1])
+
+def _json_loads(data):
+    """Parse JSON bytes, with orjson when it's installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(data, indent=False):
+    """Serialize data to JSON bytes, two-space indented or compact.
+
+    orjson only indents by two spaces and always writes UTF-8, so the stdlib
+    fallback does the same and the files look alike whichever wrote them.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+def _write_json_atomic(path, data, indent=False):
+    """Write data as JSON to path via a temporary file and os.replace().
+
+    A crash or power loss mid-write never leaves a truncated file behind. The
+    temporary file is created with mode 0666 so the umask applies, as it
+    would to a file written in place (mkstemp would make it 0600).
+    """
+    tmp_path = f'{os.path.abspath(path)}.{os.urandom(4).hex()}.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(data, indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 def save_config(config):
     """Save directory configuration to JSON file."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    global _config_cache
+    _write_json_atomic(CONFIG_FILE, config, indent=True)
+    _config_cache = (_config_key(), dict(config))
 
 def select_directory(prompt, initial_dir=None):
     """Open a directory selection dialog."""
     directory = filedialog.askdirectory(title=prompt, initialdir=initial_dir)
     return directory if directory else None
 
+def _copy_in_kernel(kernel_copy, in_fd, out_fd, size):
+    """Copy in_fd to out_fd with kernel_copy until EOF or size bytes.
+
+    Returns False if the call is refused before anything was written, so the
+    caller can try the next method.
+    """
+    offset = 0
+    try:
+        while size is None or offset < size:
+            copied = kernel_copy(in_fd, out_fd, offset, KERNEL_COPY_CHUNK)
+            if not copied:
+                break
+            offset += copied
+    except OSError:
+        if offset:
+            raise
+        return False
+    # Some filesystems report 0 bytes from copy_file_range() instead of failing,
+    # so with no size given an empty result is left to the next method too
+    return offset > 0 or size == 0
+
+# copy_file_range() can reflink or copy server-side on the same filesystem;
+# sendfile() still keeps the bytes in the kernel when it can't
+_KERNEL_COPIES = (
+    (lambda in_fd, out_fd, offset, count: os.copy_file_range(in_fd, out_fd, count, offset, offset)),
+    (lambda in_fd, out_fd, offset, count: os.sendfile(out_fd, in_fd, offset, count)),
+)
+if not hasattr(os, 'copy_file_range'):
+    _KERNEL_COPIES = _KERNEL_COPIES[1:]
+
+def _copy_in_userspace(in_fd, out_fd):
+    """Copy in_fd to out_fd through userspace, for filesystems without kernel copies."""
+    if os.fstat(in_fd).st_size > MMAP_COPY_THRESHOLD:
+        # Write straight from the page cache mapping: one write() per
+        # kernel-sized run instead of a read/write pair per 1 MiB chunk
+        with mmap.mmap(in_fd, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(out_fd, view[written:])
+    else:
+        with open(in_fd, 'rb', closefd=False) as fsrc, \
+             open(out_fd, 'wb', closefd=False) as fdst:
+            shutil.copyfileobj(fsrc, fdst)
+
+def _fast_copy(src, dst, size=None):
+    """Copy file contents and metadata using the OS-level copy path."""
+    if sys.platform == 'win32':
+        # CopyFileExW copies inside the kernel and lets ReFS share blocks
+        if not _kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+    elif sys.platform.startswith('linux'):
+        # Raw descriptors skip open()'s fstat/isatty probes, and a known size
+        # saves the final call that would only report EOF, so a small file
+        # costs two opens, one kernel copy and two closes
+        in_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+            try:
+                if not any(_copy_in_kernel(kernel_copy, in_fd, out_fd, size)
+                           for kernel_copy in _KERNEL_COPIES):
+                    _copy_in_userspace(in_fd, out_fd)
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+    else:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+
+def _file_digest(path):
+    """Return the xxh3_64 hex digest of a file's contents."""
+    digest = xxhash.xxh3_64()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _same_contents(path1, path2, size):
+    """Return True if two files of the given size hold the same bytes.
+
+    Both files are read into two reusable buffers of up to COMPARE_BLOCK_SIZE
+    and compared with one memcmp per block, instead of filecmp's 8 KiB reads
+    that each allocate new bytes objects.
+    """
+    block_size = max(1, min(size, COMPARE_BLOCK_SIZE))
+    buf1, buf2 = bytearray(block_size), bytearray(block_size)
+    view1, view2 = memoryview(buf1), memoryview(buf2)
+    with open(path1, 'rb', buffering=0) as f1, open(path2, 'rb', buffering=0) as f2:
+        while True:
+            n1 = f1.readinto(buf1)
+            n2 = f2.readinto(buf2)
+            if n1 != n2:
+                return False
+            if not n1:
+                return True
+            if n1 == block_size:
+                if buf1 != buf2:
+                    return False
+            elif view1[:n1] != view2[:n2]:
+                return False
+
+class _HashManifest:
+    """Content hashes of files written to a destination, keyed by relative path.
+
+    Kept as HASH_MANIFEST in the destination root. A recorded hash is only
+    trusted while the target still has the size and mtime it was recorded with.
+    """
+    def __init__(self, destination):
+        self.root = os.path.join(destination, '')
+        self.path = self.root + HASH_MANIFEST
+        self._lock = threading.Lock()
+        self._pending = {}  # target_file -> source digest awaiting its copy
+        self._changed = False
+        try:
+            with open(self.path, 'rb') as f:
+                self._entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _key(self, target_file):
+        return target_file[len(self.root):].replace(os.sep, '/')
+
+    def _record_stat(self, target_file, digest):
+        # Re-stat: the filesystem may round the mtime (e.g. FAT's 2 seconds)
+        st = os.stat(target_file)
+        with self._lock:
+            self._entries[self._key(target_file)] = [st.st_size, st.st_mtime_ns, digest]
+            self._changed = True
+
+    def matches(self, source_file, target_file, dst_st, src_mtime_ns):
+        """Return True if target_file is known to hold source_file's contents.
+
+        On a match the target's mtime is set to the source's, so the plain
+        stat check settles the file on the next sync. Otherwise the source
+        hash is kept for record_copy().
+        """
+        digest = _file_digest(source_file)
+        entry = self._entries.get(self._key(target_file))
+        if entry == [dst_st.st_size, dst_st.st_mtime_ns, digest]:
+            os.utime(target_file, ns=(dst_st.st_atime_ns, src_mtime_ns))
+            self._record_stat(target_file, digest)
+            return True
+        with self._lock:
+            self._pending[target_file] = digest
+        return False
+
+    def record_copy(self, target_file):
+        """Record the hash of a file just copied after a failed matches()."""
+        with self._lock:
+            digest = self._pending.pop(target_file, None)
+        if digest is not None:
+            self._record_stat(target_file, digest)
+
+    def save(self):
+        if self._changed:
+            _write_json_atomic(self.path, self._entries)
+
+def _needs_copy(source_file, target_file, src_size, src_mtime_ns, manifest=None,
+                target_entry=_UNLISTED):
+    """Return True if target_file is missing or differs from source_file.
+
+    Size and mtime settle the common case with a single stat() of the target
+    (copies preserve mtime, give or take MTIME_WINDOW seconds). When sizes
+    match but mtimes differ, the source hash is checked against the
+    destination's manifest if one is in use, and the contents are compared
+    otherwise.
+
+    target_entry is the target's DirEntry from a listing of its folder, or
+    None if the listing didn't have it. Either way the stat() comes from the
+    listing: free on Windows, and skipped entirely for missing targets.
+    """
+    if target_entry is None:
+        return True
+    try:
+        dst_st = os.stat(target_file) if target_entry is _UNLISTED else target_entry.stat()
+    except FileNotFoundError:
+        return True
+
+    if src_size != dst_st.st_size:
+        return True
+    # Whole seconds within MTIME_WINDOW count as equal, as with rsync's
+    # --modify-window: FAT drives store mtimes in 2-second steps
+    if abs(src_mtime_ns // 1_000_000_000 - dst_st.st_mtime_ns // 1_000_000_000) <= MTIME_WINDOW:
+        return False
+    if manifest is not None:
+        return not manifest.matches(source_file, target_file, dst_st, src_mtime_ns)
+    return not _same_contents(source_file, target_file, src_size)
+
+def _walk(source, destination, errors):
+    """Yield (target_folder, files) for source and every folder below it.
+
+    files holds (source_file, target_file, size, mtime_ns, name) tuples built
+    from os.scandir() entries, so the tree is read once and the source stat comes
+    from the cached DirEntry. Entries that can't be read are skipped and
+    recorded in errors as (source, target, reason), like shutil.copytree().
+    """
+    # Target folders carry a trailing separator, so target paths are built by
+    # plain concatenation instead of an os.path.join() per entry
+    stack = [(source, os.path.join(destination, ''))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        try:
+            entries = os.scandir(src_dir)
+        except OSError as why:
+            errors.append((src_dir, dst_dir, str(why)))
+            continue
+
+        files = []
+        with entries:
+            for entry in entries:
+                if src_dir == source and entry.name == HASH_MANIFEST:
+                    continue
+                target = dst_dir + entry.name
+                if entry.is_dir():
+                    # Like os.walk(), don't descend into symlinked folders
+                    if not entry.is_symlink():
+                        stack.append((entry.path, target + os.sep))
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError as why:
+                    errors.append((entry.path, target, str(why)))
+                    continue
+                files.append((entry.path, target, st.st_size, st.st_mtime_ns, entry.name))
+        yield dst_dir, files
+
+def _listing_key(name):
+    """Key for name in a _list_folder() listing."""
+    return name.casefold() if _CASE_INSENSITIVE else name
+
+def _list_folder(folder):
+    """Map entry names in folder to their DirEntry; None if it can't be listed.
+
+    Where the file system ignores case, a source renamed only in case must
+    still find its target, so names are keyed with _listing_key().
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return {_listing_key(entry.name): entry for entry in entries}
+    except OSError:
+        return None
+
+def _copy_if_needed(source_file, target_file, size, mtime_ns, name, manifest,
+                    target_entry=_UNLISTED):
+    """Copy a single file unless the destination is already up to date.
+
+    Returns (source_file, name, bytes_copied, error), where error is None or
+    a (source, target, reason) tuple for shutil.Error.
+    """
+    try:
+        if _needs_copy(source_file, target_file, size, mtime_ns, manifest, target_entry):
+            _fast_copy(source_file, target_file, size)
+            if manifest is not None:
+                manifest.record_copy(target_file)
+            return source_file, name, size, None
+    except OSError as why:
+        return source_file, name, 0, (source_file, target_file, str(why))
+    return source_file, name, 0, None
+
+def _copy_tree(source, destination, progress_queue):
+    """Mirror source into destination, posting (source_file, current, bytes_done, name) per file.
+
+    A file that fails to copy doesn't stop the sync; all failures are raised
+    together as shutil.Error at the end, as shutil.copytree() does.
+    """
+    # Create destination folder if it doesn't exist
+    Path(destination).mkdir(parents=True, exist_ok=True)
+
+    current_file = 0
+    bytes_done = 0
+    errors = []
+
+    def report(future):
+        nonlocal current_file, bytes_done
+        source_file, name, copied, error = future.result()
+        if error:
+            errors.append(error)
+        current_file += 1
+        bytes_done += copied
+        progress_queue.put((source_file, current_file, bytes_done, name))
+
+    manifest = _HashManifest(destination) if xxhash is not None else None
+
+    # Target folders known to exist. _walk() yields each folder after its
+    # parent, and the parent's listing already shows which subfolders exist,
+    # so os.mkdir() only runs for folders that are actually new.
+    dirs_seen = {os.path.join(destination, '')}
+
+    # The walk feeds the pool directly, so copying starts without a counting
+    # pre-pass. Copies release the GIL, so overlapping them hides per-file
+    # disk latency.
+    try:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            pending = set()
+            for target_folder, files in _walk(source, destination, errors):
+                # One listing of an existing target folder stands in for a
+                # stat() per target file and an os.mkdir() per subfolder; a
+                # folder just created has nothing in it
+                existing = target_folder in dirs_seen
+                if not existing:
+                    try:
+                        os.mkdir(target_folder)
+                    except FileExistsError:
+                        existing = True
+                listing = _list_folder(target_folder) if existing else {}
+                if listing:
+                    dirs_seen.update(target_folder + entry.name + os.sep
+                                     for entry in listing.values() if entry.is_dir())
+
+                for job in files:
+                    # Don't let the walk run arbitrarily far ahead of the copies
+                    if len(pending) >= MAX_PENDING_COPIES:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            report(future)
+                    target_entry = listing.get(_listing_key(job[4])) if listing is not None else _UNLISTED
+                    pending.add(executor.submit(_copy_if_needed, *job, manifest, target_entry))
+
+                finished, pending = wait(pending, timeout=0)
+                for future in finished:
+                    report(future)
+
+            for future in as_completed(pending):
+                report(future)
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+    if errors:
+        raise shutil.Error(errors)
+
 def sync_folders(source, destination):
     if not os.path.exists(source):
         raise FileNotFoundError(f"Source directory not found: {source}")
 
     # Create progress window
     progress = ProgressWindow()
-    
-    try:
-        # Count total files
-        total_files = count_files(source)
-        current_file = 0
-        
-        # Create destination folder if it doesn't exist
-        Path(destination).mkdir(parents=True, exist_ok=True)
-
-        for root, _, files in os.walk(source):
-            relative_path = os.path.relpath(root, source)
-            target_folder = os.path.join(destination, relative_path)
-
-            Path(target_folder).mkdir(parents=True, exist_ok=True)
+    progress_queue = queue.Queue()
+    errors = []
 
-            for file in files:
-                source_file = os.path.join(root, file)
-                target_file = os.path.join(target_folder, file)
+    def run():
+        try:
+            _copy_tree(source, destination, progress_queue)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            progress_queue.put(None)
 
-                current_file += 1
-                progress.update(source_file, current_file, total_files)
+    # Copy on a worker thread so the Tk thread only handles events and redraws
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
 
-                if not os.path.exists(target_file) or not filecmp.cmp(source_file, target_file, shallow=False):
-                    shutil.copy2(source_file, target_file)
-    
+    # Count files alongside the copy rather than before it; the progress bar
+    # becomes determinate once the total arrives
+    counter = threading.Thread(target=lambda: progress_queue.put(count_files(source)), daemon=True)
+    counter.start()
+    try:
+        progress.wait(progress_queue)
     finally:
-        progress.close()
+        worker.join()
+
+    if errors:
+        raise errors[0]
 
 class DirectorySelectionDialog:
     def __init__(self, mode, config):
@@ -159,7 +684,7 @@ class DirectorySelectionDialog:
         self.main_window = self.dialog.master
         
         # Set icon
-        if os.path.exists(ICON_PATH):
+        if _HAS_ICON:
             self.dialog.iconbitmap(ICON_PATH)
         
         # Make it modal
@@ -287,7 +812,7 @@ class ConfirmationDialog:
         self.prev_window = self.dialog.master
         
         # Set icon
-        if os.path.exists(ICON_PATH):
+        if _HAS_ICON:
             self.dialog.iconbitmap(ICON_PATH)
         
         # Make it modal
@@ -434,7 +959,7 @@ def main():
     root.geometry("600x480")
     
     # Set icon
-    if os.path.exists(ICON_PATH):
+    if _HAS_ICON:
         root.iconbitmap(ICON_PATH)
     
     # Apply modern styling
@@ -18,7 +18,6 @@ a = Analysis(
         'tkinter.messagebox',
         'json',
         'pathlib',
-        'filecmp',
         'shutil',
     ],
     hookspath=[],
@@ -38,7 +37,7 @@ a = Analysis(
         'idna',
     ],
     noarchive=False,
-    optimize=0,
+    optimize=2,  # Strip asserts and docstrings from the bundled bytecode
 )
 pyz = PYZ(a.pure)
 
@@ -7,49 +7,58 @@ import os
 import sys
 import tempfile
 import shutil
+import filecmp
 import json
+import importlib.util
 import unittest
 from pathlib import Path
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Import the functions we want to test
 from main import count_files, load_config, save_config, sync_folders
+from test_utils import FAST_TEMP_DIR, fast_rmtree, reflink_copy
 
 
 class SimpleFileOperationsTest(unittest.TestCase):
     """Simple tests for file operations using only standard library"""
     
-    def setUp(self):
-        """Set up temporary directories for testing"""
-        self.test_dir = tempfile.mkdtemp()
-        self.source_dir = os.path.join(self.test_dir, "source")
-        self.dest_dir = os.path.join(self.test_dir, "destination")
+    TEST_FILES = (
+        "file1.txt",
+        "file2.txt",
+        "subdir1/file3.txt",
+        "subdir2/file4.txt",
+        "subdir2/file5.txt",
+    )
+    # Folders holding the test files, created once each
+    _PARENTS = {os.path.dirname(file_path) for file_path in TEST_FILES} - {''}
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the source tree once; each test gets its own copy"""
+        cls._template_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
         
         # Create source directory structure
-        os.makedirs(self.source_dir)
-        os.makedirs(os.path.join(self.source_dir, "subdir1"))
-        os.makedirs(os.path.join(self.source_dir, "subdir2"))
+        for parent in cls._PARENTS:
+            os.makedirs(os.path.join(cls._template_dir, parent))
         
         # Create test files
-        self.test_files = [
-            "file1.txt",
-            "file2.txt", 
-            "subdir1/file3.txt",
-            "subdir2/file4.txt",
-            "subdir2/file5.txt"
-        ]
-        
-        for file_path in self.test_files:
-            full_path = os.path.join(self.source_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w') as f:
-                f.write(f"Content for {file_path}")
+        for file_path in cls.TEST_FILES:
+            Path(cls._template_dir, file_path).write_bytes(f"Content for {file_path}".encode())
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the template tree"""
+        fast_rmtree(cls._template_dir)
+    
+    def setUp(self):
+        """Set up temporary directories for testing"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.source_dir = os.path.join(self.test_dir, "source")
+        self.dest_dir = os.path.join(self.test_dir, "destination")
+        shutil.copytree(self._template_dir, self.source_dir, copy_function=reflink_copy)
     
     def tearDown(self):
         """Clean up temporary directories"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        fast_rmtree(self.test_dir)
     
     def test_count_files(self):
         """Test counting files in directory"""
@@ -74,7 +83,9 @@ class SimpleFileOperationsTest(unittest.TestCase):
         class MockProgressWindow:
             def __init__(self):
                 pass
-            def update(self, file_path, current, total):
+            def update(self, file_path, current, bytes_done, name=None):
+                pass
+            def wait(self, progress_queue):
                 pass
             def close(self):
                 pass
@@ -89,14 +100,13 @@ class SimpleFileOperationsTest(unittest.TestCase):
             sync_folders(self.source_dir, self.dest_dir)
             
             # Verify all files were copied
-            for file_path in self.test_files:
+            for file_path in self.TEST_FILES:
                 source_file = os.path.join(self.source_dir, file_path)
                 dest_file = os.path.join(self.dest_dir, file_path)
                 self.assertTrue(os.path.exists(dest_file))
                 
                 # Verify file contents are identical
-                with open(source_file, 'rb') as f1, open(dest_file, 'rb') as f2:
-                    self.assertEqual(f1.read(), f2.read())
+                self.assertTrue(filecmp.cmp(source_file, dest_file, shallow=False))
             
             print("✅ Folder sync test passed")
             
@@ -113,7 +123,9 @@ class SimpleFileOperationsTest(unittest.TestCase):
         class MockProgressWindow:
             def __init__(self):
                 pass
-            def update(self, file_path, current, total):
+            def update(self, file_path, current, bytes_done, name=None):
+                pass
+            def wait(self, progress_queue):
                 pass
             def close(self):
                 pass
@@ -128,7 +140,7 @@ class SimpleFileOperationsTest(unittest.TestCase):
             
             # Verify destination was created and files copied
             self.assertTrue(os.path.exists(non_existent_dest))
-            for file_path in self.test_files:
+            for file_path in self.TEST_FILES:
                 dest_file = os.path.join(non_existent_dest, file_path)
                 self.assertTrue(os.path.exists(dest_file))
             
@@ -190,6 +202,16 @@ def run_simple_tests():
     print("Running Simple Tests (No External Dependencies)")
     print("=" * 60)
     
+    # Spread the test classes over all cores when pytest-xdist happens to be
+    # installed; it isn't required
+    if importlib.util.find_spec('xdist') is not None:
+        import pytest
+        success = pytest.main(['-n', 'auto', '--dist=loadscope', __file__]) == 0
+        print("\n" + "=" * 60)
+        print("✅ All simple tests passed!" if success else "❌ Some tests failed!")
+        print("=" * 60)
+        return success
+    
     # Create test suite
     test_suite = unittest.TestSuite()
     
@@ -199,9 +221,8 @@ def run_simple_tests():
         SimpleConfigTest
     ]
     
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    loader = unittest.TestLoader()
+    test_suite.addTests(loader.loadTestsFromTestCase(test_class) for test_class in test_classes)
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
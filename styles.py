@@ -1,8 +1,9 @@
-import tkinter as tk
-from tkinter import ttk
+import types
 
-# Color scheme
-COLORS = {
+# tkinter is imported inside each function, so importing COLORS doesn't load Tk
+
+# Color scheme (read-only)
+COLORS = types.MappingProxyType({
     'primary': '#2196F3',  # Blue
     'secondary': '#FFC107',  # Amber
     'background': '#FFFFFF',  # White background for better contrast
@@ -11,11 +12,19 @@ COLORS = {
     'button_hover': '#1976D2',  # Darker blue
     'success': '#4CAF50',  # Green
     'error': '#F44336'  # Red
-}
+})
+
+# Tcl interpreter the styles were last applied to
+_styled_interp = None
 
 def apply_modern_style():
-    """Apply modern styling to ttk widgets"""
+    """Apply modern styling to ttk widgets (once per Tk interpreter)"""
+    global _styled_interp
+    from tkinter import ttk
     style = ttk.Style()
+    if style.tk is _styled_interp:
+        return
+    _styled_interp = style.tk
     
     # Configure main window
     style.configure('.',
@@ -59,6 +68,7 @@ def apply_modern_style():
 
 def create_title_label(parent, text):
     """Create a styled title label"""
+    from tkinter import ttk
     label = ttk.Label(parent,
                      text=text,
                      style='Modern.TLabel',
@@ -68,6 +78,7 @@ def create_title_label(parent, text):
 
 def create_button(parent, text, command):
     """Create a styled button"""
+    from tkinter import ttk
     btn = ttk.Button(parent,
                     text=text,
                     command=command,
@@ -76,4 +87,5 @@ def create_button(parent, text, command):
 
 def create_entry(parent):
     """Create a styled entry"""
+    from tkinter import ttk
     return ttk.Entry(parent, style='Modern.TEntry')
@@ -1,16 +1,19 @@
 import unittest
 import os
 import shutil
+import filecmp
 import tempfile
 import json
+import queue
+import time
+import mmap
+import importlib.util
 from unittest.mock import patch, MagicMock, call
 from pathlib import Path
 import sys
 
-# Add the current directory to the path so we can import main
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Import the functions we want to test
+import main
 from main import (
     count_files, 
     load_config, 
@@ -22,40 +25,58 @@ from main import (
     ConfirmationDialog,
     ProgressWindow
 )
+import test_utils
+from test_utils import (
+    FAST_TEMP_DIR,
+    TestDataGenerator,
+    compare_directories,
+    create_test_directory_structure,
+    fast_rmtree,
+    reflink_copy
+)
 
 
 class TestFileOperations(unittest.TestCase):
     """Test file and directory operations"""
     
-    def setUp(self):
-        """Set up temporary directories for testing"""
-        self.test_dir = tempfile.mkdtemp()
-        self.source_dir = os.path.join(self.test_dir, "source")
-        self.dest_dir = os.path.join(self.test_dir, "destination")
+    TEST_FILES = (
+        "file1.txt",
+        "file2.txt",
+        "subdir1/file3.txt",
+        "subdir2/file4.txt",
+        "subdir2/file5.txt",
+    )
+    # Folders holding the test files, created once each
+    _PARENTS = {os.path.dirname(file_path) for file_path in TEST_FILES} - {''}
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the source tree once; each test gets its own copy"""
+        cls._template_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
         
         # Create source directory structure
-        os.makedirs(self.source_dir)
-        os.makedirs(os.path.join(self.source_dir, "subdir1"))
-        os.makedirs(os.path.join(self.source_dir, "subdir2"))
+        for parent in cls._PARENTS:
+            os.makedirs(os.path.join(cls._template_dir, parent))
         
         # Create test files
-        self.test_files = [
-            "file1.txt",
-            "file2.txt", 
-            "subdir1/file3.txt",
-            "subdir2/file4.txt",
-            "subdir2/file5.txt"
-        ]
-        
-        for file_path in self.test_files:
-            full_path = os.path.join(self.source_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w') as f:
-                f.write(f"Content for {file_path}")
+        for file_path in cls.TEST_FILES:
+            Path(cls._template_dir, file_path).write_bytes(f"Content for {file_path}".encode())
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the template tree"""
+        fast_rmtree(cls._template_dir)
+    
+    def setUp(self):
+        """Set up temporary directories for testing"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.source_dir = os.path.join(self.test_dir, "source")
+        self.dest_dir = os.path.join(self.test_dir, "destination")
+        shutil.copytree(self._template_dir, self.source_dir, copy_function=reflink_copy)
     
     def tearDown(self):
         """Clean up temporary directories"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        fast_rmtree(self.test_dir)
     
     def test_count_files(self):
         """Test counting files in directory"""
@@ -83,15 +104,22 @@ class TestFileOperations(unittest.TestCase):
             sync_folders(self.source_dir, self.dest_dir)
             
             # Verify all files were copied
-            for file_path in self.test_files:
+            for file_path in self.TEST_FILES:
                 source_file = os.path.join(self.source_dir, file_path)
                 dest_file = os.path.join(self.dest_dir, file_path)
                 self.assertTrue(os.path.exists(dest_file))
                 
                 # Verify file contents are identical
-                with open(source_file, 'rb') as f1, open(dest_file, 'rb') as f2:
-                    self.assertEqual(f1.read(), f2.read())
-    
+                self.assertTrue(filecmp.cmp(source_file, dest_file, shallow=False))
+
+    def test_sync_folders_bounded_queue(self):
+        """Test that every file is copied when the walk has to wait for the pool"""
+        with patch('main.ProgressWindow'), patch('main.MAX_PENDING_COPIES', 1):
+            sync_folders(self.source_dir, self.dest_dir)
+
+        for file_path in self.TEST_FILES:
+            self.assertTrue(os.path.exists(os.path.join(self.dest_dir, file_path)))
+
     def test_sync_folders_destination_does_not_exist(self):
         """Test sync when destination directory doesn't exist"""
         # Mock the progress window
@@ -104,7 +132,7 @@ class TestFileOperations(unittest.TestCase):
             
             # Verify destination was created and files copied
             self.assertTrue(os.path.exists(self.dest_dir))
-            for file_path in self.test_files:
+            for file_path in self.TEST_FILES:
                 dest_file = os.path.join(self.dest_dir, file_path)
                 self.assertTrue(os.path.exists(dest_file))
     
@@ -122,6 +150,215 @@ class TestFileOperations(unittest.TestCase):
             
             sync_folders(self.source_dir, "/non/existent/dest")
             # Should not raise an exception as destination is created
+    
+    def test_sync_folders_collects_errors(self):
+        """Test that one unreadable file doesn't stop the rest of the sync"""
+        broken_link = os.path.join(self.source_dir, "subdir1", "broken.txt")
+        try:
+            os.symlink(os.path.join(self.test_dir, "missing.txt"), broken_link)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks not supported")
+        
+        with patch('main.ProgressWindow'):
+            with self.assertRaises(shutil.Error) as ctx:
+                sync_folders(self.source_dir, self.dest_dir)
+        
+        # The failure is reported and every other file was still copied
+        self.assertEqual([error[0] for error in ctx.exception.args[0]], [broken_link])
+        for file_path in self.TEST_FILES:
+            self.assertTrue(os.path.exists(os.path.join(self.dest_dir, file_path)))
+
+    def test_sync_folders_resync_copies_only_changes(self):
+        """Test that a repeated sync only copies files that changed"""
+        with patch('main.ProgressWindow'):
+            sync_folders(self.source_dir, self.dest_dir)
+
+            with open(os.path.join(self.source_dir, "subdir1", "file3.txt"), 'a') as f:
+                f.write(" (edited)")
+            with patch('main._fast_copy', wraps=main._fast_copy) as mock_copy:
+                sync_folders(self.source_dir, self.dest_dir)
+
+        mock_copy.assert_called_once()
+        with open(os.path.join(self.dest_dir, "subdir1", "file3.txt")) as f:
+            self.assertTrue(f.read().endswith(" (edited)"))
+
+    def test_sync_folders_resync_skips_existing_folders(self):
+        """Test that a repeated sync creates no folders that already exist"""
+        with patch('main.ProgressWindow'):
+            sync_folders(self.source_dir, self.dest_dir)
+
+            os.makedirs(os.path.join(self.source_dir, "subdir2", "new"))
+            with patch('os.mkdir', wraps=os.mkdir) as mock_mkdir:
+                sync_folders(self.source_dir, self.dest_dir)
+
+        # Only the up-front check of the destination root and the new folder
+        self.assertEqual(mock_mkdir.call_count, 2)
+        mock_mkdir.assert_called_with(os.path.join(self.dest_dir, "subdir2", "new", ""))
+
+    def test_sync_folders_mtime_window(self):
+        """Test that an mtime off by up to a second (FAT rounding) counts as unchanged"""
+        dest_file = os.path.join(self.dest_dir, "file1.txt")
+        with patch('main.ProgressWindow'):
+            sync_folders(self.source_dir, self.dest_dir)
+
+            os.utime(dest_file, ns=(0, os.stat(dest_file).st_mtime_ns + 10**9))
+            with patch('main._fast_copy', wraps=main._fast_copy) as mock_copy:
+                sync_folders(self.source_dir, self.dest_dir)
+
+        mock_copy.assert_not_called()
+
+    @patch('main._CASE_INSENSITIVE', True)
+    def test_sync_folders_case_only_rename(self):
+        """Test that renaming a source file only in case doesn't recopy it where case is ignored"""
+        with patch('main.ProgressWindow'):
+            sync_folders(self.source_dir, self.dest_dir)
+
+            os.rename(os.path.join(self.source_dir, "file1.txt"),
+                      os.path.join(self.source_dir, "FILE1.txt"))
+            with patch('main._fast_copy', wraps=main._fast_copy) as mock_copy:
+                sync_folders(self.source_dir, self.dest_dir)
+
+        mock_copy.assert_not_called()
+
+    @unittest.skipUnless(main.xxhash, "xxhash not installed")
+    def test_sync_folders_hash_manifest_skips_touched_files(self):
+        """Test that a touched but unchanged file is only copied once"""
+        source_file = os.path.join(self.source_dir, "file1.txt")
+        
+        with patch('main.ProgressWindow'):
+            sync_folders(self.source_dir, self.dest_dir)
+            
+            with patch('main._fast_copy', wraps=main._fast_copy) as mock_copy:
+                # Same size, newer mtime: unknown to the manifest, so copied
+                os.utime(source_file, ns=(0, os.stat(source_file).st_mtime_ns + 10 * 10**9))
+                sync_folders(self.source_dir, self.dest_dir)
+                self.assertEqual(mock_copy.call_count, 1)
+                
+                # Touched again: the recorded hash matches, so not copied
+                os.utime(source_file, ns=(0, os.stat(source_file).st_mtime_ns + 10 * 10**9))
+                sync_folders(self.source_dir, self.dest_dir)
+                self.assertEqual(mock_copy.call_count, 1)
+        
+        dest_file = os.path.join(self.dest_dir, "file1.txt")
+        self.assertEqual(os.stat(dest_file).st_mtime_ns, os.stat(source_file).st_mtime_ns)
+        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, main.HASH_MANIFEST)))
+
+    def test_sync_folders_progress_total_skips_manifest(self):
+        """Test that a hash manifest in the source root isn't counted towards the total"""
+        Path(self.source_dir, main.HASH_MANIFEST).write_text("{}")
+
+        with patch('main.ProgressWindow') as mock_progress:
+            sync_folders(self.source_dir, self.dest_dir)
+        progress_queue = mock_progress.return_value.wait.call_args[0][0]
+
+        # The counter thread isn't joined, so wait for both the total and the end
+        total = last_event = None
+        done = False
+        while total is None or not done:
+            item = progress_queue.get(timeout=10)
+            if item is None:
+                done = True
+            elif isinstance(item, int):
+                total = item
+            else:
+                last_event = item
+
+        self.assertEqual(total, len(self.TEST_FILES))
+        self.assertEqual(last_event[1], total)
+
+
+class TestSameContents(unittest.TestCase):
+    """Test main._same_contents, which compares files whose mtimes differ"""
+
+    BLOCK = main.COMPARE_BLOCK_SIZE
+    # Empty, below, at and just past one block, and a short final block
+    SIZES = (0, 1, BLOCK - 1, BLOCK, BLOCK + 1, 2 * BLOCK + 7)
+
+    def setUp(self):
+        """Set up a temporary directory for the compared files"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.path1 = os.path.join(self.test_dir, "one")
+        self.path2 = os.path.join(self.test_dir, "two")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        fast_rmtree(self.test_dir)
+
+    def _write_pair(self, size, flip=None):
+        """Write two copies of size bytes, the second with byte flip changed"""
+        data = bytearray(os.urandom(size))
+        Path(self.path1).write_bytes(data)
+        if flip is not None:
+            data[flip] ^= 0xFF
+        Path(self.path2).write_bytes(data)
+
+    def test_identical(self):
+        """Test that equal files compare equal at every block boundary"""
+        for size in self.SIZES:
+            with self.subTest(size=size):
+                self._write_pair(size)
+                self.assertTrue(main._same_contents(self.path1, self.path2, size))
+
+    def test_first_and_last_byte_differ(self):
+        """Test that a difference in the first or the last byte is found"""
+        for size in self.SIZES[1:]:
+            for flip in (0, size - 1):
+                with self.subTest(size=size, flip=flip):
+                    self._write_pair(size, flip)
+                    self.assertFalse(main._same_contents(self.path1, self.path2, size))
+
+    def test_second_file_shorter(self):
+        """Test that a file shrunk since it was stat'ed doesn't compare equal"""
+        self._write_pair(self.BLOCK + 1)
+        os.truncate(self.path2, self.BLOCK)
+        self.assertFalse(main._same_contents(self.path1, self.path2, self.BLOCK + 1))
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), "kernel copies are Linux only")
+class TestFastCopy(unittest.TestCase):
+    """Test main._fast_copy's fallbacks from one copy method to the next"""
+
+    # Empty, small, and large enough to be written from an mmap
+    SIZES = (0, 100, main.MMAP_COPY_THRESHOLD + 1)
+
+    def setUp(self):
+        """Set up a temporary directory for the copied files"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.src = os.path.join(self.test_dir, "src")
+        self.dst = os.path.join(self.test_dir, "dst")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        fast_rmtree(self.test_dir)
+
+    def _check_copies(self):
+        """Copy each size, with and without a known size, and compare the result"""
+        for size in self.SIZES:
+            for known_size in (size, None):
+                with self.subTest(size=size, known_size=known_size):
+                    Path(self.src).write_bytes(os.urandom(size))
+                    main._fast_copy(self.src, self.dst, known_size)
+                    self.assertTrue(filecmp.cmp(self.src, self.dst, shallow=False))
+
+    def test_userspace_copy(self):
+        """Test copying with no kernel copy available"""
+        with patch('main._KERNEL_COPIES', ()), \
+             patch('main.mmap.mmap', wraps=mmap.mmap) as mock_mmap:
+            self._check_copies()
+        # Only the two copies above MMAP_COPY_THRESHOLD were mapped
+        self.assertEqual(mock_mmap.call_count, 2)
+
+    def test_refused_kernel_copy_falls_through(self):
+        """Test that a kernel copy refused up front leaves the copy to the next method"""
+        refuse = MagicMock(side_effect=OSError(18, "Invalid cross-device link"))
+        with patch('main._KERNEL_COPIES', (refuse,) + main._KERNEL_COPIES):
+            self._check_copies()
+        refuse.assert_called()
+
+    def test_kernel_copy_reporting_nothing_falls_through(self):
+        """Test that a kernel copy returning 0 for a non-empty file isn't trusted"""
+        with patch('main._KERNEL_COPIES', (lambda *args: 0,)):
+            self._check_copies()
 
 
 class TestConfiguration(unittest.TestCase):
@@ -177,20 +414,68 @@ class TestConfiguration(unittest.TestCase):
         with open('directory_config.json', 'r') as f:
             saved_config = json.load(f)
         self.assertEqual(saved_config, self.test_config)
+    
+    def test_load_config_sees_external_changes(self):
+        """Test that a cached config is re-read after the file changes on disk"""
+        save_config(self.test_config)
+        self.assertEqual(load_config(), self.test_config)
+        
+        # Rewrite the file behind save_config's back
+        changed_config = {'work_dir': '/changed/work', 'home_dir': '/changed/home/dir'}
+        with open('directory_config.json', 'w') as f:
+            json.dump(changed_config, f)
+        
+        self.assertEqual(load_config(), changed_config)
+        save_config(self.test_config)
+    
+    @unittest.skipIf(sys.platform == 'win32', "POSIX file modes only")
+    def test_save_config_respects_umask(self):
+        """Test that the saved file gets the umask's mode, not a temp file's 0600"""
+        umask = os.umask(0o022)
+        try:
+            save_config(self.test_config)
+        finally:
+            os.umask(umask)
+        
+        self.assertEqual(os.stat('directory_config.json').st_mode & 0o777, 0o644)
+        self.assertEqual([name for name in os.listdir('.') if name.endswith('.tmp')], [])
 
 
-class TestProgressWindow(unittest.TestCase):
+class TkTestCase(unittest.TestCase):
+    """Share one withdrawn Tk root across the tests of a class.
+
+    Widgets built on mocked windows never reach Tk, but anything that falls
+    back to the default root reuses this one instead of creating its own.
+    Without a display the root is None and the tests run fully mocked.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        import tkinter as tk
+        try:
+            cls._root = tk.Tk()
+        except tk.TclError:
+            cls._root = None
+        else:
+            cls._root.withdraw()
+    
+    @classmethod
+    def tearDownClass(cls):
+        if cls._root is not None:
+            cls._root.destroy()
+
+
+class TestProgressWindow(TkTestCase):
     """Test progress window functionality"""
     
     def setUp(self):
         """Set up test environment"""
         self.root = MagicMock()
     
-    @patch('tkinter.Toplevel')
-    @patch('os.path.exists')
-    def test_progress_window_creation(self, mock_exists, mock_toplevel):
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_creation(self, mock_toplevel):
         """Test progress window creation"""
-        mock_exists.return_value = False  # No icon file
         mock_window = MagicMock()
         mock_toplevel.return_value = mock_window
         
@@ -200,33 +485,137 @@ class TestProgressWindow(unittest.TestCase):
         mock_toplevel.assert_called_once()
         self.assertEqual(progress.window, mock_window)
     
-    @patch('tkinter.Toplevel')
-    @patch('os.path.exists')
-    def test_progress_window_update(self, mock_exists, mock_toplevel):
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_update(self, mock_toplevel):
         """Test progress window update"""
-        mock_exists.return_value = False
         mock_window = MagicMock()
         mock_toplevel.return_value = mock_window
         
         progress = ProgressWindow("Test Progress")
         
-        # Mock the labels and progress bar
-        progress.file_label = MagicMock()
+        # Mock the label variables and progress bar
+        progress.file_var = MagicMock()
         progress.progress = MagicMock()
-        progress.stats_label = MagicMock()
+        progress.stats_var = MagicMock()
         
-        # Test update
-        progress.update("/path/to/file.txt", 5, 10)
+        # Test update (2 KB copied in 2 seconds)
+        progress._start = 10.0
+        with patch('time.monotonic', return_value=12.0):
+            progress.update("/path/to/file.txt", 5, 2048)
         
         # Verify updates were called
-        progress.file_label.config.assert_called_with(text="Copying: file.txt")
-        progress.progress.__setitem__.assert_called_with('value', 50.0)
-        progress.stats_label.config.assert_called_with(
-            text="Progress: 5 of 10 files (50.0%)"
+        progress.file_var.set.assert_called_with("Copying: file.txt")
+        progress.progress.step.assert_called_once()
+        progress.stats_var.set.assert_called_with(
+            "Processed 5 files, 2.0 KB copied (1.0 KB/s)"
+        )
+    
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_update_throttled(self, mock_toplevel):
+        """Test that redraws closer together than the update interval are skipped"""
+        mock_toplevel.return_value = MagicMock()
+        
+        progress = ProgressWindow("Test Progress")
+        progress.file_var = MagicMock()
+        progress.progress = MagicMock()
+        progress.stats_var = MagicMock()
+        
+        with patch('time.monotonic', side_effect=[100.0, 100.01, 100.05]):
+            progress.update("/path/to/a.txt", 1, 0)
+            progress.update("/path/to/b.txt", 2, 0)
+            progress.update("/path/to/c.txt", 3, 0)
+        
+        # The second call came 10 ms after the first and was dropped
+        self.assertEqual(progress.file_var.set.call_count, 2)
+        progress.file_var.set.assert_called_with("Copying: c.txt")
+        
+        # The last file is drawn even inside the interval
+        progress.total = 4
+        progress.progress_var = MagicMock()
+        with patch('time.monotonic', return_value=100.06):
+            progress.update("/path/to/d.txt", 4, 0, "d.txt")
+        progress.progress_var.set.assert_called_once_with(4)
+        progress.file_var.set.assert_called_with("Copying: d.txt")
+    
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_determinate(self, mock_toplevel):
+        """Test that the bar shows real progress once the total is known"""
+        mock_toplevel.return_value = MagicMock()
+        
+        progress = ProgressWindow("Test Progress")
+        progress.progress = MagicMock()
+        progress.progress_var = MagicMock()
+        progress.stats_var = MagicMock()
+        
+        progress_queue = queue.Queue()
+        progress_queue.put(20)
+        progress_queue.put(("/path/to/file.txt", 5, 2048))
+        progress._start = 10.0
+        with patch('time.monotonic', return_value=12.0):
+            progress.poll(progress_queue)
+        
+        progress.progress.config.assert_called_once_with(mode='determinate', maximum=20)
+        progress.progress.step.assert_not_called()
+        progress.progress_var.set.assert_called_once_with(5)
+        progress.stats_var.set.assert_called_with(
+            "Processed 5 of 20 files, 2.0 KB copied (1.0 KB/s)"
         )
+    
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_poll(self, mock_toplevel):
+        """Test that polling shows the latest event and closes when the sync ends"""
+        mock_window = MagicMock()
+        mock_toplevel.return_value = mock_window
+        
+        progress = ProgressWindow("Test Progress")
+        progress.update = MagicMock()
+        
+        progress_queue = queue.Queue()
+        progress_queue.put(("/path/to/a.txt", 1, 10))
+        progress.poll(progress_queue)
+        
+        # Still running: the event is shown and the next poll is scheduled
+        progress.update.assert_called_once_with("/path/to/a.txt", 1, 10)
+        mock_window.after.assert_called_once()
+        
+        progress_queue.put(("/path/to/b.txt", 2, 20))
+        progress_queue.put(("/path/to/c.txt", 3, 30))
+        progress_queue.put(None)
+        progress.poll(progress_queue)
+        
+        # Only the latest event is drawn, then the window closes
+        progress.update.assert_called_with("/path/to/c.txt", 3, 30)
+        self.assertEqual(progress.update.call_count, 2)
+        mock_window.destroy.assert_called_once()
+        mock_window.after.assert_called_once()
+
+    
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_progress_window_wait_after_sync_finished(self, mock_toplevel):
+        """Test that a sync which ends before wait() still closes the window cleanly"""
+        mock_window = MagicMock()
+        mock_toplevel.return_value = mock_window
+        
+        progress = ProgressWindow("Test Progress")
+        progress_queue = queue.Queue()
+        progress_queue.put(None)
+        
+        # The window must still exist when wait_window() starts
+        mock_window.wait_window.side_effect = lambda: mock_window.destroy.assert_not_called()
+        progress.wait(progress_queue)
+        mock_window.after.assert_called_once_with(0, progress.poll, progress_queue)
+        
+        # The event loop then runs the scheduled poll, which closes the window
+        progress.poll(progress_queue)
+        mock_window.destroy.assert_called_once()
 
 
-class TestDirectorySelectionDialog(unittest.TestCase):
+class TestDirectorySelectionDialog(TkTestCase):
     """Test directory selection dialog"""
     
     def setUp(self):
@@ -235,11 +624,10 @@ class TestDirectorySelectionDialog(unittest.TestCase):
         self.config = {'work_dir': '/test/work', 'home_dir': '/test/home'}
     
     @patch('tkinter.StringVar')
-    @patch('tkinter.Toplevel')
-    @patch('os.path.exists')
-    def test_work_mode_dialog_creation(self, mock_exists, mock_toplevel, mock_stringvar):
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_work_mode_dialog_creation(self, mock_toplevel, mock_stringvar):
         """Test work mode dialog creation"""
-        mock_exists.return_value = False
         mock_dialog = MagicMock()
         mock_toplevel.return_value = mock_dialog
         
@@ -251,11 +639,10 @@ class TestDirectorySelectionDialog(unittest.TestCase):
         self.assertEqual(dialog.config, self.config)
     
     @patch('tkinter.StringVar')
-    @patch('tkinter.Toplevel')
-    @patch('os.path.exists')
-    def test_home_mode_dialog_creation(self, mock_exists, mock_toplevel, mock_stringvar):
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_home_mode_dialog_creation(self, mock_toplevel, mock_stringvar):
         """Test home mode dialog creation"""
-        mock_exists.return_value = False
         mock_dialog = MagicMock()
         mock_toplevel.return_value = mock_dialog
         
@@ -267,18 +654,17 @@ class TestDirectorySelectionDialog(unittest.TestCase):
         self.assertEqual(dialog.config, self.config)
 
 
-class TestConfirmationDialog(unittest.TestCase):
+class TestConfirmationDialog(TkTestCase):
     """Test confirmation dialog"""
     
     def setUp(self):
         """Set up test environment"""
         self.root = MagicMock()
     
-    @patch('tkinter.Toplevel')
-    @patch('os.path.exists')
-    def test_confirmation_dialog_creation(self, mock_exists, mock_toplevel):
+    @patch('tkinter.Toplevel', spec=True)
+    @patch('main._HAS_ICON', False)  # No icon file
+    def test_confirmation_dialog_creation(self, mock_toplevel):
         """Test confirmation dialog creation"""
-        mock_exists.return_value = False
         mock_dialog = MagicMock()
         mock_toplevel.return_value = mock_dialog
         
@@ -419,7 +805,7 @@ class TestIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
         self.source_dir = os.path.join(self.test_dir, "source")
         self.dest_dir = os.path.join(self.test_dir, "destination")
         
@@ -430,7 +816,7 @@ class TestIntegration(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        fast_rmtree(self.test_dir)
     
     @patch('main.ProgressWindow')
     def test_complete_sync_workflow(self, mock_progress):
@@ -446,29 +832,276 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "test.txt")))
         
         # Verify file content
-        with open(os.path.join(self.dest_dir, "test.txt"), 'r') as f:
-            content = f.read()
-        self.assertEqual(content, "Test content")
+        self.assertTrue(filecmp.cmp(os.path.join(self.source_dir, "test.txt"),
+                                    os.path.join(self.dest_dir, "test.txt"), shallow=False))
+
+
+class TestCompareDirectories(unittest.TestCase):
+    """Test test_utils.compare_directories, which verifies syncs"""
+    
+    def setUp(self):
+        """Set up two matching trees and keep the hash cache out of the way"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.dir1 = os.path.join(self.test_dir, "one")
+        self.dir2 = os.path.join(self.test_dir, "two")
+        create_test_directory_structure(self.dir1, TestDataGenerator.create_simple_structure())
+        shutil.copytree(self.dir1, self.dir2)
+        
+        cache = test_utils._HashCache(os.path.join(self.test_dir, "hashes.db"))
+        cache.disabled = True
+        patcher = patch('test_utils._hash_cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        fast_rmtree(self.test_dir)
+    
+    def _rewrite_same_size(self, rel_path):
+        """Change a file in dir2 without changing its size or mtime"""
+        path = os.path.join(self.dir2, rel_path)
+        st = os.stat(path)
+        with open(path, 'r+b') as f:
+            f.write(b'X')
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    
+    def test_identical(self):
+        """Test that matching trees compare as identical"""
+        result = compare_directories(self.dir1, self.dir2)
+        self.assertTrue(result['identical'])
+        self.assertEqual(result['missing_files'] + result['extra_files'] + result['different_files'], [])
+    
+    def test_missing_extra_and_different(self):
+        """Test that each kind of difference is reported under its own key"""
+        os.remove(os.path.join(self.dir2, "file1.txt"))
+        Path(self.dir2, "subdir1", "new.txt").write_bytes(b"new")
+        self._rewrite_same_size(os.path.join("subdir2", "subsubdir", "file6.txt"))
+        
+        result = compare_directories(self.dir1, self.dir2)
+        
+        self.assertFalse(result['identical'])
+        self.assertEqual(result['missing_files'], ["file1.txt"])
+        self.assertEqual(result['extra_files'], [os.path.join("subdir1", "new.txt")])
+        self.assertEqual(result['different_files'], [os.path.join("subdir2", "subsubdir", "file6.txt")])
+    
+    def test_size_mismatch_skips_hashing(self):
+        """Test that files of different sizes are reported without being hashed"""
+        Path(self.dir2, "file2.txt").write_bytes(b"shorter")
+        self.assertNotEqual(os.path.getsize(os.path.join(self.dir1, "file2.txt")),
+                            os.path.getsize(os.path.join(self.dir2, "file2.txt")))
+        
+        with patch('test_utils.get_file_hash', wraps=test_utils.get_file_hash) as mock_hash:
+            result = compare_directories(self.dir1, self.dir2)
+        
+        self.assertEqual(result['different_files'], ["file2.txt"])
+        hashed = {os.path.basename(c.args[0]) for c in mock_hash.call_args_list}
+        self.assertNotIn("file2.txt", hashed)
+        self.assertIn("file1.txt", hashed)
+    
+    def test_quick_mode(self):
+        """Test that quick mode trusts equal sizes and mtimes"""
+        self._rewrite_same_size("file1.txt")
+        
+        self.assertEqual(compare_directories(self.dir1, self.dir2)['different_files'], ["file1.txt"])
+        with patch('test_utils.get_file_hash') as mock_hash:
+            self.assertTrue(compare_directories(self.dir1, self.dir2, quick=True)['identical'])
+        mock_hash.assert_not_called()
+    
+    def test_process_pool_hashing(self):
+        """Test the process pool used for trees with many files"""
+        self._rewrite_same_size("file1.txt")
+        
+        with patch('test_utils.PARALLEL_HASH_MIN_FILES', 1), \
+             patch('test_utils.ProcessPoolExecutor', wraps=test_utils.ProcessPoolExecutor) as mock_pool:
+            result = compare_directories(self.dir1, self.dir2)
+        
+        mock_pool.assert_called_once()
+        self.assertEqual(result['different_files'], ["file1.txt"])
+    
+    def test_thread_pool_hashing(self):
+        """Test the thread pool used for large files on multi-core machines"""
+        self._rewrite_same_size("file1.txt")
+        
+        with patch('test_utils.THREADED_HASH_MIN_BYTES', 1), \
+             patch('os.cpu_count', return_value=2), \
+             patch('test_utils.ThreadPoolExecutor', wraps=test_utils.ThreadPoolExecutor) as mock_pool:
+            result = compare_directories(self.dir1, self.dir2)
+        
+        mock_pool.assert_called_once()
+        self.assertEqual(result['different_files'], ["file1.txt"])
+    
+    def test_mmap_hashing(self):
+        """Test that hashing through mmap gives the same digests as reading"""
+        path = os.path.join(self.dir1, "file1.txt")
+        expected = test_utils._hash_file_contents(path)
+        
+        with patch('test_utils.MMAP_HASH_THRESHOLD', 1), \
+             patch('mmap.mmap', wraps=mmap.mmap) as mock_mmap:
+            self.assertEqual(test_utils._hash_file_contents(path), expected)
+            self._rewrite_same_size("file1.txt")
+            result = compare_directories(self.dir1, self.dir2)
+        
+        mock_mmap.assert_called()
+        self.assertEqual(result['different_files'], ["file1.txt"])
+
+
+class TestHashCache(unittest.TestCase):
+    """Test the SQLite digest cache behind test_utils.get_file_hash"""
+    
+    def setUp(self):
+        """Give each test its own cache and a file old enough to be cached"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        self.file_path = os.path.join(self.test_dir, "file.txt")
+        Path(self.file_path).write_bytes(b"original")
+        
+        self.cache = test_utils._HashCache(os.path.join(self.test_dir, "hashes.db"))
+        for patcher in (patch('test_utils._hash_cache', self.cache),
+                        patch('test_utils.HASH_CACHE_MIN_AGE', 0)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.cache._conn is not None:
+            self.cache._conn.close()
+        fast_rmtree(self.test_dir)
+    
+    def _hash_counting_reads(self):
+        """Hash the file, returning the digest and how many times it was read"""
+        with patch('test_utils._hash_file_contents', wraps=test_utils._hash_file_contents) as mock_read:
+            digest = test_utils.get_file_hash(self.file_path)
+        return digest, mock_read.call_count
+    
+    def test_cache_hit(self):
+        """Test that an unchanged file's digest comes from the cache"""
+        digest, reads = self._hash_counting_reads()
+        self.assertEqual(reads, 1)
+        self.assertEqual(self._hash_counting_reads(), (digest, 0))
+    
+    def test_recent_files_not_cached(self):
+        """Test that files changed within HASH_CACHE_MIN_AGE are hashed every time"""
+        with patch('test_utils.HASH_CACHE_MIN_AGE', 60):
+            self._hash_counting_reads()
+            self.assertEqual(self._hash_counting_reads()[1], 1)
+    
+    def test_size_change_invalidates(self):
+        """Test that a file of a new size is hashed again"""
+        old_digest, _ = self._hash_counting_reads()
+        Path(self.file_path).write_bytes(b"longer contents")
+        
+        digest, reads = self._hash_counting_reads()
+        self.assertEqual(reads, 1)
+        self.assertNotEqual(digest, old_digest)
+    
+    def test_mtime_change_invalidates(self):
+        """Test that a touched file is hashed again"""
+        self._hash_counting_reads()
+        st = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns - 10_000_000_000))
+        
+        self.assertEqual(self._hash_counting_reads()[1], 1)
+    
+    @unittest.skipIf(sys.platform == 'win32', "st_ctime is the creation time on Windows")
+    def test_same_size_rewrite_with_restored_mtime(self):
+        """Test that restoring the mtime after a rewrite doesn't return a stale digest"""
+        old_digest, _ = self._hash_counting_reads()
+        st = os.stat(self.file_path)
+        time.sleep(0.05)  # Past the filesystem's timestamp granularity
+        Path(self.file_path).write_bytes(b"modified")
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        digest, reads = self._hash_counting_reads()
+        self.assertEqual(reads, 1)
+        self.assertNotEqual(digest, old_digest)
+    
+    def test_database_error_disables_cache(self):
+        """Test that hashing carries on uncached when the database can't be opened"""
+        expected = test_utils._hash_file_contents(self.file_path)
+        broken = test_utils._HashCache(self.test_dir)  # A folder, not a database
+        
+        with patch('test_utils._hash_cache', broken):
+            self.assertEqual(test_utils.get_file_hash(self.file_path), expected)
+            self.assertEqual(test_utils.get_file_hash(self.file_path), expected)
+        self.assertTrue(broken.disabled)
+
+
+class TestRandomFixture(unittest.TestCase):
+    """Test the seeded fixture trees test_utils.get_random_fixture keeps"""
+    
+    def setUp(self):
+        """Keep fixtures built here out of the shared cache"""
+        self.test_dir = tempfile.mkdtemp(dir=FAST_TEMP_DIR)
+        patcher = patch('test_utils.FIXTURE_CACHE_DIR', os.path.join(self.test_dir, "fixtures"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        fast_rmtree(self.test_dir)
+    
+    def _get_counting_builds(self):
+        """Get the fixture, returning its path and how many times it was built"""
+        with patch('test_utils._write_random_tree', wraps=test_utils._write_random_tree) as mock_build:
+            fixture = test_utils.get_random_fixture(seed=7, num_files=20)
+        return fixture, mock_build.call_count
+    
+    def test_same_seed_same_tree(self):
+        """Test that a fixture built again from the same seed is the same tree"""
+        first = os.path.join(self.test_dir, "first")
+        test_utils.create_random_test_files(first, num_files=20, seed=7)
+        fast_rmtree(test_utils.FIXTURE_CACHE_DIR)
+        
+        fixture, builds = self._get_counting_builds()
+        self.assertEqual(builds, 1)
+        with patch('test_utils._hash_cache.disabled', True):
+            self.assertTrue(compare_directories(first, fixture)['identical'])
+    
+    def test_reuses_cached_fixture(self):
+        """Test that a fixture is built once and then served from the cache"""
+        fixture, builds = self._get_counting_builds()
+        self.assertEqual(builds, 1)
+        self.assertEqual(self._get_counting_builds(), (fixture, 0))
+    
+    def test_rebuilds_incomplete_fixture(self):
+        """Test that a fixture missing its marker or a file is built again"""
+        fixture, _ = self._get_counting_builds()
+        
+        os.unlink(fixture + ".complete")
+        self.assertEqual(self._get_counting_builds(), (fixture, 1))
+        
+        first_file = next(path for _, _, path in test_utils.get_file_stats(fixture).values())
+        os.unlink(first_file)
+        self.assertEqual(self._get_counting_builds(), (fixture, 1))
+        self.assertEqual(test_utils.summarize_directory(fixture)[0], 20)
 
 
 if __name__ == '__main__':
+    # Spread the test classes over all cores when pytest-xdist is installed
+    if importlib.util.find_spec('xdist') is not None:
+        import pytest
+        sys.exit(pytest.main(['-n', 'auto', '--dist=loadscope', __file__]))
+    
     # Create test suite
     test_suite = unittest.TestSuite()
     
     # Add test classes
     test_classes = [
         TestFileOperations,
+        TestSameContents,
+        TestFastCopy,
         TestConfiguration,
         TestProgressWindow,
         TestDirectorySelectionDialog,
         TestConfirmationDialog,
         TestModeFunctions,
-        TestIntegration
+        TestIntegration,
+        TestCompareDirectories,
+        TestHashCache,
+        TestRandomFixture
     ]
     
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    loader = unittest.TestLoader()
+    test_suite.addTests(loader.loadTestsFromTestCase(test_class) for test_class in test_classes)
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
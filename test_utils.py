@@ -2,12 +2,52 @@
 Utility functions for testing the mirroring tool
 """
 import os
+import sys
+import contextlib
+import functools
 import tempfile
 import shutil
 import random
-import string
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+import hashlib
+import mmap
+import sqlite3
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import blake3  # Optional: faster hashing in compare_directories
+except ImportError:
+    blake3 = None
+
+HASH_CHUNK_SIZE = 1024 * 1024
+MMAP_HASH_THRESHOLD = 1024 * 1024  # Files this large are hashed through mmap
+# Common files needed before compare_directories hashes in worker processes;
+# below this, starting the pool costs more than it saves
+PARALLEL_HASH_MIN_FILES = 2000
+# Bytes to hash before fewer files are hashed in threads instead; small files
+# hold the GIL for most of their hashing, so threads only add contention
+THREADED_HASH_MIN_BYTES = 16 * 1024 * 1024
+# Test folders go on tmpfs where Linux provides one, so fixtures stay in RAM;
+# None means the usual temp folder
+FAST_TEMP_DIR = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+# Trees made by create_random_test_files(seed=...) are kept here for reuse
+FIXTURE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'mirror_test_fixtures')
+# Part of each cached fixture's name; bump it when _write_random_tree's output changes
+_RANDOM_TREE_FORMAT = 2
+# Digests survive between test runs here, keyed by path, size, mtime, inode
+# and ctime
+HASH_CACHE_FILE = os.path.join(tempfile.gettempdir(), 'mirror_hash.db')
+# Seconds a file must go unmodified (mtime and ctime) before its digest is
+# cached; a same-size rewrite within the filesystem's timestamp granularity
+# would otherwise go unseen
+HASH_CACHE_MIN_AGE = 2
+# Seconds two mtimes may differ for compare_directories(quick=True) to trust
+# equal-size files without hashing them, as main.MTIME_WINDOW does for syncs
+QUICK_MTIME_WINDOW = 1
 
 
 def create_test_directory_structure(base_path, structure):
@@ -31,20 +71,31 @@ def create_test_directory_structure(base_path, structure):
             }
         }
     """
-    for name, content in structure.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict):
-            # It's a directory
-            os.makedirs(path, exist_ok=True)
-            create_test_directory_structure(path, content)
-        else:
-            # It's a file
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w') as f:
-                f.write(content)
+    # Folders already made, so each costs one makedirs() rather than one per file
+    created_dirs = set()
+    
+    def create(folder, structure):
+        for name, content in structure.items():
+            path = os.path.join(folder, name)
+            if isinstance(content, dict):
+                # It's a directory
+                os.makedirs(path, exist_ok=True)
+                created_dirs.add(path)
+                create(path, content)
+            else:
+                # It's a file, written as one binary write: a write of this size
+                # goes to the OS in a single syscall whatever the buffer size
+                parent = os.path.dirname(path)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                with open(path, 'wb') as f:
+                    f.write(content.encode('utf-8'))
+    
+    create(base_path, structure)
 
 
-def create_random_test_files(base_path, num_files=10, max_depth=3):
+def create_random_test_files(base_path, num_files=10, max_depth=3, seed=None):
     """
     Create random test files in a directory structure.
     
@@ -52,42 +103,290 @@ def create_random_test_files(base_path, num_files=10, max_depth=3):
         base_path (str): Base directory path
         num_files (int): Number of files to create
         max_depth (int): Maximum directory depth
+        seed (int): Generate a reproducible tree. It is built once under
+            FIXTURE_CACHE_DIR and copied into base_path on later calls.
     """
+    if seed is None:
+        _write_random_tree(base_path, num_files, max_depth, random.Random())
+    else:
+        fixture = get_random_fixture(seed, num_files, max_depth)
+        shutil.copytree(fixture, base_path, copy_function=reflink_copy, dirs_exist_ok=True)
+
+
+def get_random_fixture(seed, num_files=10, max_depth=3):
+    """
+    Return the cached tree create_random_test_files(seed=seed) would copy.
+    
+    The tree is built under FIXTURE_CACHE_DIR on first use and kept for
+    later runs. Callers that only read files can use it directly instead
+    of copying it; it must not be modified. A fixture without its
+    completion marker, or missing files, is rebuilt.
+    """
+    fixture = os.path.join(FIXTURE_CACHE_DIR,
+                           f'{seed}-{num_files}-{max_depth}-v{_RANDOM_TREE_FORMAT}')
+    marker = fixture + '.complete'
+    if _fixture_complete(fixture, marker, num_files):
+        return fixture
+    
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(marker)
+    fast_rmtree(fixture)
+    # Build beside the final name and rename, so a concurrent or
+    # interrupted run never leaves a half-written fixture behind
+    os.makedirs(FIXTURE_CACHE_DIR, exist_ok=True)
+    building = tempfile.mkdtemp(dir=FIXTURE_CACHE_DIR)
+    _write_random_tree(building, num_files, max_depth, random.Random(seed))
+    try:
+        os.rename(building, fixture)
+    except OSError:
+        # Another process finished the same fixture first
+        fast_rmtree(building)
+    # Written last, so the marker only exists next to a finished tree
+    Path(marker).write_text(str(num_files))
+    return fixture
+
+
+def _fixture_complete(fixture, marker, num_files):
+    """True if marker records num_files and fixture still holds that many files"""
+    try:
+        recorded = int(Path(marker).read_text())
+    except (OSError, ValueError):
+        return False
+    return recorded == num_files and summarize_directory(fixture)[0] == num_files
+
+
+def _write_random_tree(base_path, num_files, max_depth, rng):
+    """Generate every path and content first, then create each folder and file once"""
     file_extensions = ['.txt', '.doc', '.pdf', '.jpg', '.png', '.mp3', '.mp4']
     
+    files = []
     for i in range(num_files):
-        # Random depth
-        depth = random.randint(0, max_depth)
-        
-        # Create random path
-        path_parts = []
-        for _ in range(depth):
-            path_parts.append(''.join(random.choices(string.ascii_lowercase, k=8)))
+        # Random depth and path; one getrandbits() call gives all 8 hex
+        # characters of a folder name instead of a choice per character
+        path_parts = [f'{rng.getrandbits(32):08x}' for _ in range(rng.randint(0, max_depth))]
         
         # Add filename
-        filename = f'file_{i}_{random.randint(1000, 9999)}'
-        filename += random.choice(file_extensions)
+        filename = f'file_{i}_{rng.randint(1000, 9999)}'
+        filename += rng.choice(file_extensions)
         path_parts.append(filename)
         
-        # Create full path
-        file_path = os.path.join(base_path, *path_parts)
-        
-        # Create directory if needed
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Create file with random content
-        content = ''.join(random.choices(string.ascii_letters + string.digits, k=random.randint(10, 100)))
-        with open(file_path, 'w') as f:
+        # Hex content, likewise drawn in one call
+        length = rng.randint(10, 100)
+        content = f'{rng.getrandbits(4 * length):0{length}x}'
+        files.append((os.path.join(base_path, *path_parts), content.encode()))
+    
+    for folder in {os.path.dirname(file_path) for file_path, _ in files}:
+        os.makedirs(folder, exist_ok=True)
+    
+    # Each file is a single write, so skip Python's buffering
+    for file_path, content in files:
+        with open(file_path, 'wb', buffering=0) as f:
             f.write(content)
 
 
-def compare_directories(dir1, dir2):
+def reflink_copy(src, dst):
+    """
+    Copy a file for shutil.copytree(), sharing blocks with the source when possible.
+    
+    os.copy_file_range() reflinks on Btrfs/XFS and copies in the kernel
+    elsewhere; when it's unavailable or refused this falls back to
+    shutil.copy2().
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if not remaining:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def fast_rmtree(path):
+    """
+    Remove a test directory tree, ignoring errors like shutil.rmtree(ignore_errors=True).
+    
+    Test fixtures hold only plain files and folders, so this skips rmtree's
+    per-entry symlink checks: a bottom-up os.walk() unlinks the files and
+    removes each folder once it is empty.
+    """
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            with contextlib.suppress(OSError):
+                os.unlink(os.path.join(root, name))
+        for name in dirs:
+            with contextlib.suppress(OSError):
+                os.rmdir(os.path.join(root, name))
+    with contextlib.suppress(OSError):
+        os.rmdir(path)
+
+
+class _HashCache:
+    """
+    File digests kept in an SQLite database between test runs.
+    
+    An entry is used only while the file still has the size, mtime, inode and
+    ctime it was hashed with. Restoring the mtime after a rewrite (as a
+    copystat-preserving sync does) still changes the ctime, so such files are
+    re-hashed. On Windows st_ctime is the creation time, so a same-size
+    rewrite in place with its mtime restored can go unnoticed there.
+    
+    Any database error (read-only temp folder, locked file) turns the cache
+    off for the rest of the process.
+    """
+    
+    SCHEMA_VERSION = 2  # Bump when the table changes; older tables are dropped
+    
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        self.disabled = False
+    
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS hashes')
+                conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            conn.execute('CREATE TABLE IF NOT EXISTS hashes ('
+                         'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, '
+                         'ino INTEGER, ctime_ns INTEGER, algorithm TEXT, digest BLOB)')
+            self._conn = conn
+        return self._conn
+    
+    def get(self, path, stamp, algorithm):
+        """Return the cached digest, or None if the file changed or isn't cached
+        
+        stamp is the file's (size, mtime_ns, ino, ctime_ns), see _file_stamp().
+        """
+        if self.disabled:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT size, mtime_ns, ino, ctime_ns, algorithm, digest '
+                    'FROM hashes WHERE path = ?', (path,)).fetchone()
+        except sqlite3.Error:
+            self.disabled = True
+            return None
+        if row is not None and row[:5] == (*stamp, algorithm):
+            return row[5]
+        return None
+    
+    def put(self, path, stamp, algorithm, digest):
+        if self.disabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute('INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                 (path, *stamp, algorithm, digest))
+        except sqlite3.Error:
+            self.disabled = True
+
+
+_hash_cache = _HashCache(HASH_CACHE_FILE)
+
+
+def _file_stamp(st):
+    """Identify a file's version for the hash cache from its stat result"""
+    return st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns
+
+
+def get_file_hash(filepath):
+    """
+    Hash a file's contents for comparison.
+    
+    Uses BLAKE3 when the blake3 package is installed, and SHA-256 otherwise
+    (through hashlib.file_digest() on Python 3.11+). Digests are cached in
+    HASH_CACHE_FILE, so unchanged files aren't read again on later runs.
+    """
+    st = os.stat(filepath)
+    path = os.path.abspath(filepath)
+    stamp = _file_stamp(st)
+    algorithm = 'sha256' if blake3 is None else 'blake3'
+    digest = _hash_cache.get(path, stamp, algorithm)
+    if digest is None:
+        digest = _hash_file_contents(filepath)
+        last_change_ns = max(st.st_mtime_ns, st.st_ctime_ns)
+        if time.time_ns() - last_change_ns >= HASH_CACHE_MIN_AGE * 1_000_000_000:
+            _hash_cache.put(path, stamp, algorithm, digest)
+    return digest
+
+
+def _hash_file_contents(filepath):
+    """
+    Hash a file's bytes.
+    
+    Files of MMAP_HASH_THRESHOLD bytes or more are mapped and fed to the hash
+    straight from the page cache; smaller ones are read in HASH_CHUNK_SIZE
+    blocks, where mapping would cost more than the copy it saves.
+    """
+    with open(filepath, 'rb', buffering=0) as f:
+        file_hash = hashlib.sha256() if blake3 is None else blake3.blake3()
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                file_hash.update(mapped)
+            return file_hash.digest()
+        if blake3 is None and hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').digest()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.digest()
+
+
+def _hash_pair(pair):
+    """Hash both copies of a common file; module-level so a process pool can pickle it"""
+    file_path, file1_path, file2_path = pair
+    return file_path, get_file_hash(file1_path), get_file_hash(file2_path)
+
+
+def get_file_stats(directory):
+    """
+    Map each file under directory to (size, mtime_ns, full path).
+    
+    Keys are paths relative to directory, built from each folder's prefix in
+    a single scandir walk; DirEntry.stat() needs no extra syscall on Windows.
+    """
+    stats = {}
+    stack = [(directory, '')]
+    while stack:
+        folder, prefix = stack.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                if entry.is_dir():
+                    # Like os.walk(), list symlinked folders but don't follow them
+                    if not entry.is_symlink():
+                        stack.append((entry.path, rel_path + os.sep))
+                else:
+                    st = entry.stat()
+                    stats[rel_path] = (st.st_size, st.st_mtime_ns, entry.path)
+    return stats
+
+
+def compare_directories(dir1, dir2, quick=False):
     """
     Compare two directories recursively.
     
     Args:
         dir1 (str): First directory path
         dir2 (str): Second directory path
+        quick (bool): Treat files with equal sizes and mtimes within
+            QUICK_MTIME_WINDOW seconds as identical instead of hashing them
     
     Returns:
         dict: Comparison results with 'identical', 'missing_files', 'extra_files', 'different_files'
@@ -99,40 +398,49 @@ def compare_directories(dir1, dir2):
         'different_files': []
     }
     
-    def get_file_list(directory):
-        files = []
-        for root, _, filenames in os.walk(directory):
-            for filename in filenames:
-                full_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(full_path, directory)
-                files.append(rel_path)
-        return set(files)
-    
-    def get_file_hash(filepath):
-        """Get file hash for comparison"""
-        import hashlib
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
-    # Get file lists
-    files1 = get_file_list(dir1)
-    files2 = get_file_list(dir2)
+    # Get file lists; sizes let unequal files skip hashing
+    stats1 = get_file_stats(dir1)
+    stats2 = get_file_stats(dir2)
     
     # Find missing and extra files
-    result['missing_files'] = list(files1 - files2)
-    result['extra_files'] = list(files2 - files1)
-    
-    # Check common files
-    common_files = files1 & files2
-    for file_path in common_files:
-        file1_path = os.path.join(dir1, file_path)
-        file2_path = os.path.join(dir2, file_path)
-        
-        if get_file_hash(file1_path) != get_file_hash(file2_path):
+    result['missing_files'] = list(stats1.keys() - stats2.keys())
+    result['extra_files'] = list(stats2.keys() - stats1.keys())
+    
+    # Check common files; only those of equal size need hashing
+    pairs = []
+    pair_bytes = 0
+    for file_path, (size, mtime_ns, full_path) in stats1.items():
+        if file_path not in stats2:
+            continue
+        other_size, other_mtime_ns, other_full_path = stats2[file_path]
+        if other_size != size:
             result['different_files'].append(file_path)
+        elif quick and abs(other_mtime_ns - mtime_ns) < QUICK_MTIME_WINDOW * 1_000_000_000:
+            continue
+        else:
+            pairs.append((file_path, full_path, other_full_path))
+            pair_bytes += size
+    
+    if len(pairs) >= PARALLEL_HASH_MIN_FILES:
+        # Hashing is CPU-bound, so spread it over processes; spawn rather than
+        # fork, since the caller may hold threads or a Tk interpreter
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+            for file_path, hash1, hash2 in executor.map(_hash_pair, pairs, chunksize=16):
+                if hash1 != hash2:
+                    result['different_files'].append(file_path)
+    elif pair_bytes >= THREADED_HASH_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        # hashlib and blake3 release the GIL while hashing large buffers, so
+        # threads hash both sides in parallel without the pool start-up cost
+        with ThreadPoolExecutor() as executor:
+            hashes1 = executor.map(get_file_hash, [pair[1] for pair in pairs])
+            hashes2 = executor.map(get_file_hash, [pair[2] for pair in pairs])
+            for (file_path, _, _), hash1, hash2 in zip(pairs, hashes1, hashes2):
+                if hash1 != hash2:
+                    result['different_files'].append(file_path)
+    else:
+        for file_path, hash1, hash2 in map(_hash_pair, pairs):
+            if hash1 != hash2:
+                result['different_files'].append(file_path)
     
     # Update identical flag
     if result['missing_files'] or result['extra_files'] or result['different_files']:
@@ -141,6 +449,23 @@ def compare_directories(dir1, dir2):
     return result
 
 
+def summarize_directory(directory):
+    """Return (file count, total bytes) for a tree"""
+    stats = get_file_stats(directory)
+    return len(stats), sum(size for size, _, _ in stats.values())
+
+
+def quick_compare(dir1, dir2):
+    """
+    Cheaply check whether two trees look alike.
+    
+    True when both hold the same number of files and the same total size.
+    Nothing is read or hashed, so this can miss changed contents; use
+    compare_directories() for a file-by-file answer.
+    """
+    return summarize_directory(dir1) == summarize_directory(dir2)
+
+
 class MockTkinter:
     """Mock Tkinter components for testing"""
     
@@ -228,20 +553,23 @@ class TestDataGenerator:
     def create_large_structure(num_files=100):
         """Create a large directory structure for performance tests"""
         structure = {}
+        subdir1 = {}
+        subdir2 = {}
         for i in range(num_files):
             if i < num_files // 3:
                 # Files in root
                 structure[f'file_{i}.txt'] = f'Content for file {i}'
             elif i < 2 * num_files // 3:
                 # Files in subdir1
-                if 'subdir1' not in structure:
-                    structure['subdir1'] = {}
-                structure['subdir1'][f'file_{i}.txt'] = f'Content for file {i}'
+                subdir1[f'file_{i}.txt'] = f'Content for file {i}'
             else:
                 # Files in subdir2
-                if 'subdir2' not in structure:
-                    structure['subdir2'] = {}
-                structure['subdir2'][f'file_{i}.txt'] = f'Content for file {i}'
+                subdir2[f'file_{i}.txt'] = f'Content for file {i}'
+        # Subfolders are only listed when they hold files, as before
+        if subdir1:
+            structure['subdir1'] = subdir1
+        if subdir2:
+            structure['subdir2'] = subdir2
         return structure
     
     @staticmethod
@@ -261,53 +589,55 @@ class TestDataGenerator:
         }
 
 
+# Tkinter classes patched by patch_tkinter_components, with the mock each returns
+_TKINTER_PATCHES = (
+    ('tkinter.Toplevel', MockTkinter.mock_toplevel),
+    ('tkinter.ttk.Frame', MockTkinter.mock_frame),
+    ('tkinter.ttk.Label', MockTkinter.mock_label),
+    ('tkinter.ttk.Progressbar', MockTkinter.mock_progressbar),
+    ('tkinter.Button', MockTkinter.mock_button),
+    ('tkinter.ttk.Entry', MockTkinter.mock_entry),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _tkinter_mocks():
+    """Build the mocks for patch_tkinter_components once"""
+    return tuple((target, make_mock()) for target, make_mock in _TKINTER_PATCHES)
+
+
 def patch_tkinter_components():
-    """Patch Tkinter components for testing"""
-    patches = []
-    
-    # Patch Toplevel
-    mock_toplevel = MockTkinter.mock_toplevel()
-    patches.append(patch('tkinter.Toplevel', return_value=mock_toplevel))
-    
-    # Patch Frame
-    mock_frame = MockTkinter.mock_frame()
-    patches.append(patch('tkinter.ttk.Frame', return_value=mock_frame))
-    
-    # Patch Label
-    mock_label = MockTkinter.mock_label()
-    patches.append(patch('tkinter.ttk.Label', return_value=mock_label))
-    
-    # Patch Progressbar
-    mock_progress = MockTkinter.mock_progressbar()
-    patches.append(patch('tkinter.ttk.Progressbar', return_value=mock_progress))
-    
-    # Patch Button
-    mock_button = MockTkinter.mock_button()
-    patches.append(patch('tkinter.Button', return_value=mock_button))
-    
-    # Patch Entry
-    mock_entry = MockTkinter.mock_entry()
-    patches.append(patch('tkinter.ttk.Entry', return_value=mock_entry))
+    """
+    Patch Tkinter components for testing.
     
+    The mocks are shared between calls; each call clears their recorded calls
+    (keeping configured return values) and returns new patch objects.
+    """
+    patches = []
+    for target, mock in _tkinter_mocks():
+        mock.reset_mock()
+        patches.append(patch(target, return_value=mock))
     return patches
 
 
-class TemporaryDirectory:
-    """Context manager for temporary directories"""
+class TemporaryDirectory(tempfile.TemporaryDirectory):
+    """
+    tempfile.TemporaryDirectory placed in FAST_TEMP_DIR unless dir is given.
     
-    def __init__(self, suffix='', prefix='tmp', dir=None):
-        self.suffix = suffix
-        self.prefix = prefix
-        self.dir = dir
-        self.path = None
+    Cleanup errors are ignored, as with the old hand-rolled version; the
+    context manager still yields the path, also available as .path.
+    """
     
-    def __enter__(self):
-        self.path = tempfile.mkdtemp(suffix=self.suffix, prefix=self.prefix, dir=self.dir)
-        return self.path
+    def __init__(self, suffix=None, prefix=None, dir=None):
+        kwargs = {}
+        if sys.version_info >= (3, 10):
+            kwargs['ignore_cleanup_errors'] = True
+        super().__init__(suffix=suffix, prefix=prefix,
+                         dir=FAST_TEMP_DIR if dir is None else dir, **kwargs)
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.path and os.path.exists(self.path):
-            shutil.rmtree(self.path, ignore_errors=True)
+    @property
+    def path(self):
+        return self.name
 
 
 def run_tests_with_coverage():